@@ -17,20 +17,122 @@ Usage:
 """
 
 import argparse
+import hashlib
+import io
 import json
+import os
 import re
 import subprocess
 import sys
+import threading
 import time
-from dataclasses import asdict, dataclass, is_dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields, is_dataclass
 from pathlib import Path
-from typing import Optional, Union
-
-
-@dataclass
+from typing import Callable, Optional, Union
+
+try:
+    # Optional: faster (de)serialization of saved results. The runner stays
+    # dependency-free and falls back to the stdlib json module.
+    import orjson
+except ImportError:
+    orjson = None
+
+# Compiled AOT executables are reused while their sources are unchanged
+_AOT_CACHE_DIR = Path.home() / ".cache" / "yomu-bench"
+_AOT_CACHE_MAX_AGE_S = 7 * 24 * 60 * 60
+
+# Categories reported by bench_compare.dart (best-effort, order matters)
+_CATEGORIES = ("Standard", "Complex", "HiRes", "Distorted", "Noise", "Edge")
+
+# Legacy benchmark summary
+_RE_TOTAL = re.compile(r"Total processed: (\d+) images \((\d+) success\)")
+_RE_TIME = re.compile(r"Total decode time: (\d+)µs")
+_RE_AVG = re.compile(r"Average decode time: ([\d.]+)ms")
+_LEGACY_MARKERS = (
+    "Total processed:",
+    "Total decode time:",
+    "Average decode time:",
+    "BENCHMARK_PASS",
+)
+
+# Comparative benchmark output, scanned in a single pass. Every
+# alternative stays within one line; `lastgroup` names the outer group of
+# the alternative that matched.
+_RE_OUTPUT = re.compile(
+    r"(?P<section>^[ \t]*---[ \t]+(?P<header>.+)[ \t]+---)"
+    r"|(?P<stats>Avg:[ \t]+(?P<avg>[\d.]+)ms.*p95:[ \t]+(?P<p95>[\d.]+)ms)"
+    r"|(?P<overhead>Overhead:[ \t]+(?P<oh_ms>[+\-]?[\d.]+)ms[ \t]+"
+    r"\((?P<oh_pct>[+\-]?[\d.]+)%\))"
+    rf"|(?P<category>(?P<cat>{'|'.join(_CATEGORIES)})[ \t]+: "
+    r"Avg (?P<cat_avg>[\d.]+)ms, p95 (?P<cat_p95>[\d.]+)ms)"
+    r"|(?P<details>DETAILS:(?P<row>.*))",
+    re.MULTILINE,
+)
+
+# Static Markdown report blocks
+_MD_REPORT_HEADER = (
+    "# 📊 Benchmark Report\n"
+    "\n"
+    "## Overview\n"
+    "| Metric | Mode | JIT (dart run) | AOT (compiled) |\n"
+    "| :--- | :--- | :--- | :--- |\n"
+)
+_MD_CATEGORY_TABLE_HEADER = (
+    "| Category | Average (ms) | p95 (ms) | Notes |\n| :--- | :--- | :--- | :--- |\n"
+)
+_MD_QR_CATEGORY_HEADER = (
+    "\n## 📈 QR Code Performance (AOT)\n" + _MD_CATEGORY_TABLE_HEADER
+)
+_MD_BARCODE_CATEGORY_HEADER = (
+    "\n## 📈 Barcode Performance (AOT)\n" + _MD_CATEGORY_TABLE_HEADER
+)
+_MD_DETAILS_HEADER = (
+    "\n"
+    "## 🔍 Detailed Performance (AOT)\n"
+    "<details>\n"
+    "<summary>Click to view per-image breakdown</summary>\n"
+    "\n"
+    "| Image | Baseline (ms) | All (ms) | Diff (ms) |\n"
+    "| :--- | :---: | :---: | :---: |\n"
+)
+_MD_COMPARISON_HEADER = "# 🚀 Benchmark Comparison Report\n\n"
+_MD_COMPARISON_METRICS_HEADER = (
+    "## 🏁 Main Metrics (AOT)\n"
+    "| Metric | Base (main) | Target (PR) | Diff | State |\n"
+    "| :--- | :--- | :--- | :--- | :--- |\n"
+)
+_MD_COMPARISON_CATEGORY_HEADER = (
+    "\n"
+    "## 📊 QR Category Breakdown\n"
+    "| Category | Base Avg | Target Avg | Diff |\n"
+    "| :--- | :--- | :--- | :--- |\n"
+)
+
+# Report row templates
+_TIME_CELL_TPL = "{0:.2f}ms -> {1:.2f}ms ({2:+.1f}%)"
+_CAT_ROW_TPL = "| **{0}** | {1:.2f}ms | {2:.2f}ms | {3} |\n"
+_DETAIL_ROW_TPL = "| {0} | {1:.3f} | {2:.3f} | {3} |\n"
+
+# QR categories shown in the Markdown report, in order, with their notes
+_QR_CATEGORY_NOTES = {
+    "Standard": "Version 1-4, Alphanumeric",
+    "Complex": "High Versions (V5+)",
+    "4K": "3840×2160 images",
+    "FullHD": "1920×1080 images",
+    "Distorted": "Rotated / Tilted / Skewed",
+    "Noise": "Noisy background",
+    "Edge": "Tiny, uniform, error cases",
+}
+_CAT_ORDER_MAP = {cat: i for i, cat in enumerate(_QR_CATEGORY_NOTES)}
+
+
+@dataclass(slots=True)
 class LegacyBenchmarkResult:
     """Results from a standard benchmark run."""
 
+    KIND = "legacy"
+
     mode: str
     total_images: int
     success_count: int
@@ -39,10 +141,12 @@ class LegacyBenchmarkResult:
     passed: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class ComparativeBenchmarkResult:
     """Results from a comparative benchmark run (e.g. Mode A vs Mode B)."""
 
+    KIND = "comparative"
+
     mode: str
     # QR Section
     qr_baseline_ms: float  # Yomu.qrOnly (Standard)
@@ -75,14 +179,42 @@ class ComparativeBenchmarkResult:
 BenchmarkResult = Union[LegacyBenchmarkResult, ComparativeBenchmarkResult]
 
 
-def run_command(cmd: list[str], cwd: str = ".") -> tuple[int, str, str]:
-    """Run a command and return exit code, stdout, stderr."""
+def run_command(
+    cmd: list[str], cwd: str = ".", on_line: Optional[Callable[[str], None]] = None
+) -> tuple[int, str, str]:
+    """Run a command and return exit code, stdout, stderr.
+
+    With `on_line`, stdout is streamed to it line by line while the command
+    is still running and is not retained (the returned stdout is empty).
+    """
     try:
-        result = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
-        return result.returncode, result.stdout, result.stderr
+        # Dart prints UTF-8 (e.g. "µs") regardless of the host locale
+        proc = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            encoding="utf-8",
+            errors="replace",
+        )
     except FileNotFoundError:
         return 1, "", f"Command not found: {cmd[0]}"
 
+    if on_line is None:
+        stdout, stderr = proc.communicate()
+        return proc.returncode, stdout, stderr
+
+    # Drain stderr in the background so a full pipe never blocks the child
+    stderr_parts = []
+    drain = threading.Thread(target=lambda: stderr_parts.append(proc.stderr.read()))
+    drain.start()
+    with proc.stdout:
+        for line in proc.stdout:
+            on_line(line)
+    drain.join()
+    proc.stderr.close()
+    return proc.wait(), "", "".join(stderr_parts)
+
 
 def parse_benchmark_output(output: str) -> Optional[BenchmarkResult]:
     """Parse benchmark output to extract metrics."""
@@ -96,10 +228,14 @@ def parse_benchmark_output(output: str) -> Optional[BenchmarkResult]:
 
 
 def _parse_legacy(output: str) -> Optional[LegacyBenchmarkResult]:
+    # Cheap rejection for empty / error output before running the regexes
+    if "Total processed:" not in output:
+        return None
+
     # Look for the summary lines
-    total_match = re.search(r"Total processed: (\d+) images \((\d+) success\)", output)
-    time_match = re.search(r"Total decode time: (\d+)µs", output)
-    avg_match = re.search(r"Average decode time: ([\d.]+)ms", output)
+    total_match = _RE_TOTAL.search(output)
+    time_match = _RE_TIME.search(output)
+    avg_match = _RE_AVG.search(output)
 
     # Some benchmarks output BENCHMARK_PASS explicitly
     passed_explicit = "BENCHMARK_PASS" in output
@@ -141,53 +277,76 @@ class BenchmarkParser:
 
         # Additional data
         self.params = {}  # For categories, etc
+        self.cat_matches = {}  # category -> [(avg, p95), ...] in output order
         self.qr_cats = {}
         self.bc_cats = {}
         self.details = []
 
-    def parse(self, output: str) -> Optional[ComparativeBenchmarkResult]:
-        lines = output.splitlines()
+        # Incremental (feed_line) mode
+        self.comparative = False
+        self.legacy_lines = []
 
-        for line in lines:
-            self._process_line(line)
+    def parse(self, output: str) -> Optional[ComparativeBenchmarkResult]:
+        for m in _RE_OUTPUT.finditer(output):
+            self._dispatch(m)
 
         self._commit_section()
 
-        return self._build_result(output)
+        return self._build_result()
 
-    def _process_line(self, line: str):
-        line = line.strip()
-        if not line:
-            return
+    def feed_line(self, line: str):
+        """Consume one line of output while the benchmark is still running."""
+        if "COMPARATIVE BENCHMARK" in line:
+            self.comparative = True
+        elif any(marker in line for marker in _LEGACY_MARKERS):
+            self.legacy_lines.append(line)
+
+        m = _RE_OUTPUT.search(line)
+        if m:
+            self._dispatch(m)
+
+    def finish(self) -> Optional[BenchmarkResult]:
+        """Build the result from the lines fed so far."""
+        if not self.comparative:
+            return _parse_legacy("".join(self.legacy_lines))
 
-        # Section headers
-        sec_match = re.search(r"^---\s+(.+)\s+---", line)
-        if sec_match:
-            header = sec_match.group(1)
+        self._commit_section()
+
+        return self._build_result()
+
+    def _dispatch(self, m: re.Match):
+        kind = m.lastgroup
+        if kind == "section":
+            header = m.group("header")
             # Ignore sub-headers for categories
             if "Metrics" in header:
                 return
 
             self._commit_section()
             self.current_section = header
-            return
-
-        # Stats
-        if "Yomu." in line:
-            stats_match = re.search(r"Avg:\s+([\d.]+)ms.*p95:\s+([\d.]+)ms", line)
-            if stats_match:
-                avg = float(stats_match.group(1))
-                p95 = float(stats_match.group(2))
-                self.section_avgs.append((avg, p95))
-
-        # Overhead
-        oh_match = re.search(
-            r"Overhead:\s+([+\-]?[\d.]+)ms\s+\(([+\-]?[\d.]+)%\)", line
-        )
-        if oh_match:
-            ms = float(oh_match.group(1))
-            pct = float(oh_match.group(2))
+        elif kind == "stats":
+            avg = float(m.group("avg"))
+            p95 = float(m.group("p95"))
+            self.section_avgs.append((avg, p95))
+        elif kind == "overhead":
+            ms = float(m.group("oh_ms"))
+            pct = float(m.group("oh_pct"))
             self.section_overhead = (ms, pct)
+        elif kind == "category":
+            self.cat_matches.setdefault(sys.intern(m.group("cat")), []).append(
+                (float(m.group("cat_avg")), float(m.group("cat_p95")))
+            )
+        else:
+            # Split instead of matching `(.+)\|(.+)...`, which backtracks
+            # heavily on long rows.
+            parts = m.group("row").split("|", 3)
+            if len(parts) != 4:
+                return
+            image, time_a, time_b, diff_str = (part.strip() for part in parts)
+            # Image names and diffs repeat across sections; share one copy
+            self.details.append(
+                (sys.intern(image), float(time_a), float(time_b), sys.intern(diff_str))
+            )
 
     def _commit_section(self):
         if not self.current_section or not self.section_avgs:
@@ -212,7 +371,7 @@ class BenchmarkParser:
         self.section_avgs = []
         self.section_overhead = None
 
-    def _build_result(self, output: str) -> Optional[ComparativeBenchmarkResult]:
+    def _build_result(self) -> Optional[ComparativeBenchmarkResult]:
         if not self.qr_standard_stats and not self.barcode_stats:
             # Fallback if absolutely nothing is found (unlikely in valid run)
             # But the caller checks for None return
@@ -240,11 +399,8 @@ class BenchmarkParser:
         bc_ohm = get_stat(self.barcode_stats, "overhead", 0)
         bc_ohp = get_stat(self.barcode_stats, "overhead", 1)
 
-        # Parse Categories (Best effort regex over full output)
-        self._parse_categories(output)
-
-        # Parse Details
-        self._parse_details(output)
+        # Categories (best effort: A/B reports of QR first, then Barcode)
+        self._commit_categories()
 
         # Pass logic
         passed = qr_ohp < 15.0
@@ -269,32 +425,13 @@ class BenchmarkParser:
             details=self.details,
         )
 
-    def _parse_categories(self, output: str):
-        for cat in ["Standard", "Complex", "HiRes", "Distorted", "Noise", "Edge"]:
-            matches = re.findall(rf"{cat}\s+: Avg ([\d.]+)ms, p95 ([\d.]+)ms", output)
+    def _commit_categories(self):
+        for cat in _CATEGORIES:
+            matches = self.cat_matches.get(cat, ())
             if len(matches) >= 2:
-                self.qr_cats[cat] = (
-                    float(matches[0][0]),
-                    float(matches[0][1]),
-                    float(matches[1][0]),
-                    float(matches[1][1]),
-                )
+                self.qr_cats[cat] = (*matches[0], *matches[1])
             if len(matches) >= 4:
-                self.bc_cats[cat] = (
-                    float(matches[2][0]),
-                    float(matches[2][1]),
-                    float(matches[3][0]),
-                    float(matches[3][1]),
-                )
-
-    def _parse_details(self, output: str):
-        details = re.findall(r"DETAILS:(.+)\|(.+)\|(.+)\|(.+)", output)
-        for d in details:
-            image = d[0].strip()
-            time_a = float(d[1].strip())
-            time_b = float(d[2].strip())
-            diff_str = d[3].strip()
-            self.details.append((image, time_a, time_b, diff_str))
+                self.bc_cats[cat] = (*matches[2], *matches[3])
 
 
 def _parse_comparative(output: str) -> Optional[ComparativeBenchmarkResult]:
@@ -306,49 +443,93 @@ def run_jit_benchmark(
 ) -> Optional[BenchmarkResult]:
     """Run benchmark in JIT mode (dart run)."""
     print(f"🔄 Running JIT benchmark ({script_path})...")
-    code, stdout, stderr = run_command(["dart", "run", script_path])
+    parser = BenchmarkParser()
+    code, _, stderr = run_command(
+        ["dart", "run", script_path], on_line=parser.feed_line
+    )
 
     if code != 0:
         print(f"❌ JIT benchmark failed: {stderr}")
         return None
 
-    result = parse_benchmark_output(stdout)
+    result = parser.finish()
     if result:
         result.mode = "JIT"
     return result
 
 
+def _aot_cache_key(script_path: str) -> str:
+    """Hash everything the compiled executable depends on."""
+    script = Path(script_path)
+    sources = {script, Path("pubspec.yaml"), Path("pubspec.lock")}
+    sources.update(script.parent.rglob("*.dart"))
+    sources.update(Path("lib").rglob("*.dart"))
+
+    digest = hashlib.sha256()
+    # `dart --version` prints to stderr on older SDKs
+    _, out, err = run_command(["dart", "--version"])
+    digest.update((out + err).encode())
+    for path in sorted(sources):
+        if path.is_file():
+            digest.update(str(path).encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _evict_stale_aot_executables():
+    """Remove cached executables that have not been used for a week."""
+    if not _AOT_CACHE_DIR.is_dir():
+        return
+
+    cutoff = time.time() - _AOT_CACHE_MAX_AGE_S
+    for path in _AOT_CACHE_DIR.iterdir():
+        # Another run may rename or delete the entry between listing and stat
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except FileNotFoundError:
+            continue
+
+
 def run_aot_benchmark(
     script_path: str = "benchmark/bench_compare.dart",
 ) -> Optional[BenchmarkResult]:
     """Run benchmark in AOT mode (compiled executable)."""
     exe_name = Path(script_path).stem + "_exe"
-    exe_path = Path("benchmark") / exe_name
-    exe_path = Path(exe_path)  # correct path usage
+    _evict_stale_aot_executables()
+    exe_path = _AOT_CACHE_DIR / f"{exe_name}-{_aot_cache_key(script_path)}"
 
     # Compile if needed
-    print("🔨 Compiling AOT executable...")
-    code, stdout, stderr = run_command(
-        ["dart", "compile", "exe", script_path, "-o", str(exe_path)]
-    )
+    if exe_path.exists():
+        print(f"♻️ Reusing cached AOT executable ({exe_path})")
+        exe_path.touch()
+    else:
+        print("🔨 Compiling AOT executable...")
+        _AOT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Compile next to the target and rename, so an interrupted build is
+        # never picked up as a cached executable
+        tmp_path = exe_path.with_name(f"{exe_path.name}.{os.getpid()}.tmp")
+        code, stdout, stderr = run_command(
+            ["dart", "compile", "exe", script_path, "-o", str(tmp_path)]
+        )
 
-    if code != 0:
-        print(f"❌ Compilation failed: {stderr}")
-        return None
+        if code != 0:
+            tmp_path.unlink(missing_ok=True)
+            print(f"❌ Compilation failed: {stderr}")
+            return None
+
+        tmp_path.replace(exe_path)
 
     # Run compiled executable
     print("🔄 Running AOT benchmark (compiled)...")
-    code, stdout, stderr = run_command([str(exe_path)])
-
-    # Clean up executable
-    if exe_path.exists():
-        exe_path.unlink()
+    parser = BenchmarkParser()
+    code, _, stderr = run_command([str(exe_path)], on_line=parser.feed_line)
 
     if code != 0:
         print(f"❌ AOT benchmark failed: {stderr}")
         return None
 
-    result = parse_benchmark_output(stdout)
+    result = parser.finish()
     if result:
         result.mode = "AOT"
     return result
@@ -358,202 +539,165 @@ def generate_markdown_report(
     jit: ComparativeBenchmarkResult, aot: ComparativeBenchmarkResult
 ) -> str:
     """Generate a Markdown report for GitHub Summary / PR Comment."""
-    md = []
-    md.append("# 📊 Benchmark Report")
-    md.append("")
+    buf = io.StringIO()
+    w = buf.write
 
     # Overview Table
-    md.append("## Overview")
-    md.append("| Metric | Mode | JIT (dart run) | AOT (compiled) |")
-    md.append("| :--- | :--- | :--- | :--- |")
+    w(_MD_REPORT_HEADER)
 
-    jit_qr = f"{jit.qr_baseline_ms:.2f}ms -> {jit.qr_all_ms:.2f}ms ({jit.qr_overhead_pct:+.1f}%)"
-    aot_qr = f"{aot.qr_baseline_ms:.2f}ms -> {aot.qr_all_ms:.2f}ms ({aot.qr_overhead_pct:+.1f}%)"
-    md.append(f"| **QR Standard** | `qr -> all` | {jit_qr} | {aot_qr} |")
+    jit_qr = _TIME_CELL_TPL.format(
+        jit.qr_baseline_ms, jit.qr_all_ms, jit.qr_overhead_pct
+    )
+    aot_qr = _TIME_CELL_TPL.format(
+        aot.qr_baseline_ms, aot.qr_all_ms, aot.qr_overhead_pct
+    )
+    w(f"| **QR Standard** | `qr -> all` | {jit_qr} | {aot_qr} |\n")
 
-    jit_stress = f"{jit.qr_stress_baseline_ms:.2f}ms -> {jit.qr_stress_all_ms:.2f}ms ({jit.qr_stress_overhead_pct:+.1f}%)"
-    aot_stress = f"{aot.qr_stress_baseline_ms:.2f}ms -> {aot.qr_stress_all_ms:.2f}ms ({aot.qr_stress_overhead_pct:+.1f}%)"
-    md.append(f"| **QR Stress** | `qr -> all` | {jit_stress} | {aot_stress} |")
+    jit_stress = _TIME_CELL_TPL.format(
+        jit.qr_stress_baseline_ms, jit.qr_stress_all_ms, jit.qr_stress_overhead_pct
+    )
+    aot_stress = _TIME_CELL_TPL.format(
+        aot.qr_stress_baseline_ms, aot.qr_stress_all_ms, aot.qr_stress_overhead_pct
+    )
+    w(f"| **QR Stress** | `qr -> all` | {jit_stress} | {aot_stress} |\n")
 
-    jit_bc = f"{jit.barcode_baseline_ms:.2f}ms -> {jit.barcode_all_ms:.2f}ms ({jit.barcode_overhead_pct:+.1f}%)"
-    aot_bc = f"{aot.barcode_baseline_ms:.2f}ms -> {aot.barcode_all_ms:.2f}ms ({aot.barcode_overhead_pct:+.1f}%)"
-    md.append(f"| **Barcode** | `bar -> all` | {jit_bc} | {aot_bc} |")
+    jit_bc = _TIME_CELL_TPL.format(
+        jit.barcode_baseline_ms, jit.barcode_all_ms, jit.barcode_overhead_pct
+    )
+    aot_bc = _TIME_CELL_TPL.format(
+        aot.barcode_baseline_ms, aot.barcode_all_ms, aot.barcode_overhead_pct
+    )
+    w(f"| **Barcode** | `bar -> all` | {jit_bc} | {aot_bc} |\n")
 
     jit_status = "✅ PASS" if jit.passed else "⚠️ WARN"
     aot_status = "✅ PASS" if aot.passed else "⚠️ WARN"
-    md.append(f"| **Status** | | {jit_status} | {aot_status} |")
+    w(f"| **Status** | | {jit_status} | {aot_status} |\n")
 
     # QR Category Breakdown (AOT)
     if aot.qr_categories:
-        md.append("")
-        md.append("## 📈 QR Code Performance (AOT)")
-        md.append("| Category | Average (ms) | p95 (ms) | Notes |")
-        md.append("| :--- | :--- | :--- | :--- |")
+        w(_MD_QR_CATEGORY_HEADER)
 
         cats = aot.qr_categories
-        for cat in [
-            "Standard",
-            "Complex",
-            "4K",
-            "FullHD",
-            "Distorted",
-            "Noise",
-            "Edge",
-        ]:
-            if cat in cats:
-                c = cats[cat]
-                note = ""
-                if cat == "Standard":
-                    note = "Version 1-4, Alphanumeric"
-                elif cat == "Complex":
-                    note = "High Versions (V5+)"
-                elif cat == "4K":
-                    note = "3840×2160 images"
-                elif cat == "FullHD":
-                    note = "1920×1080 images"
-                elif cat == "Distorted":
-                    note = "Rotated / Tilted / Skewed"
-                elif cat == "Noise":
-                    note = "Noisy background"
-                elif cat == "Edge":
-                    note = "Tiny, uniform, error cases"
-
-                md.append(f"| **{cat}** | {c[2]:.2f}ms | {c[3]:.2f}ms | {note} |")
+        w(
+            "".join(
+                _CAT_ROW_TPL.format(cat, cats[cat][2], cats[cat][3], note)
+                for cat, note in _QR_CATEGORY_NOTES.items()
+                if cat in cats
+            )
+        )
 
     # Barcode Category Breakdown (AOT)
     if aot.barcode_categories and len(aot.barcode_categories) > 0:
-        md.append("")
-        md.append("## 📈 Barcode Performance (AOT)")
-        md.append("| Category | Average (ms) | p95 (ms) | Notes |")
-        md.append("| :--- | :--- | :--- | :--- |")
+        w(_MD_BARCODE_CATEGORY_HEADER)
 
         cats = aot.barcode_categories
-        for cat in ["Standard", "Complex", "HiRes", "Distorted", "Noise", "Edge"]:
-            if cat in cats:
-                c = cats[cat]
-                md.append(f"| **{cat}** | {c[2]:.2f}ms | {c[3]:.2f}ms | |")
+        w(
+            "".join(
+                _CAT_ROW_TPL.format(cat, cats[cat][2], cats[cat][3], "")
+                for cat in _CATEGORIES
+                if cat in cats
+            )
+        )
 
     # Detailed Table
     if aot.details:
-        md.append("")
-        md.append("## 🔍 Detailed Performance (AOT)")
-        md.append("<details>")
-        md.append("<summary>Click to view per-image breakdown</summary>")
-        md.append("")
-        md.append("| Image | Baseline (ms) | All (ms) | Diff (ms) |")
-        md.append("| :--- | :---: | :---: | :---: |")
+        w(_MD_DETAILS_HEADER)
+        w("".join(_DETAIL_ROW_TPL.format(*d) for d in aot.details))
 
-        for img, t1, t2, diff in aot.details:
-            md.append(f"| {img} | {t1:.3f} | {t2:.3f} | {diff} |")
+        w("</details>\n")
 
-        md.append("</details>")
-
-    return "\n".join(md)
+    return buf.getvalue()
 
 
 def print_comparison(jit: BenchmarkResult, aot: BenchmarkResult):
     """Print a comparison table of JIT vs AOT results."""
 
-    print("\n" + "=" * 80)
-    print("📊 BENCHMARK COMPARISON")
-    print("=" * 80)
+    sys.stdout.write("\n" + "=" * 80 + "\n📊 BENCHMARK COMPARISON\n" + "=" * 80 + "\n")
 
-    if isinstance(jit, LegacyBenchmarkResult) and isinstance(
-        aot, LegacyBenchmarkResult
-    ):
-        _print_legacy_comparison(jit, aot)
-    elif isinstance(jit, ComparativeBenchmarkResult) and isinstance(
-        aot, ComparativeBenchmarkResult
-    ):
-        _print_comparative_comparison(jit, aot)
-
-        # Generate and save report
-        report = generate_markdown_report(jit, aot)
-        with open("benchmark_summary.md", "w") as f:
-            f.write(report)
-        print("\n📝 Report saved to benchmark_summary.md")
-        print("   (See benchmark_summary.md for detailed per-image breakdown)")
-
-    else:
+    if jit.KIND != aot.KIND:
         print("❌ Error: Mixed benchmark results (Legacy vs Comparative)")
+        return
+
+    _PRINTERS[jit.KIND](jit, aot)
 
 
 def _print_legacy_comparison(jit: LegacyBenchmarkResult, aot: LegacyBenchmarkResult):
     speedup = jit.avg_time_ms / aot.avg_time_ms if aot.avg_time_ms > 0 else 0
 
-    print(f"{'Metric':<25} | {'JIT (dart run)':<18} | {'AOT (compiled)':<18}")
-    print("-" * 80)
-    print(f"{'Images Processed':<25} | {jit.total_images:<18} | {aot.total_images:<18}")
-    print(f"{'Success Count':<25} | {jit.success_count:<18} | {aot.success_count:<18}")
-    print(
-        f"{'Total Time (µs)':<25} | {jit.total_time_us:<18} | {aot.total_time_us:<18}"
-    )
-    print(
-        f"{'Average Time (ms)':<25} | {jit.avg_time_ms:<18.3f} | {aot.avg_time_ms:<18.3f}"
+    buf = io.StringIO()
+    w = buf.write
+
+    w(f"{'Metric':<25} | {'JIT (dart run)':<18} | {'AOT (compiled)':<18}\n")
+    w("-" * 80 + "\n")
+    w(f"{'Images Processed':<25} | {jit.total_images:<18} | {aot.total_images:<18}\n")
+    w(f"{'Success Count':<25} | {jit.success_count:<18} | {aot.success_count:<18}\n")
+    w(f"{'Total Time (µs)':<25} | {jit.total_time_us:<18} | {aot.total_time_us:<18}\n")
+    w(
+        f"{'Average Time (ms)':<25} | {jit.avg_time_ms:<18.3f} | {aot.avg_time_ms:<18.3f}\n"
     )
-    print(
-        f"{'Status':<25} | {'✅ PASS' if jit.passed else '⚠️ WARN':<18} | {'✅ PASS' if aot.passed else '⚠️ WARN':<18}"
+    w(
+        f"{'Status':<25} | {'✅ PASS' if jit.passed else '⚠️ WARN':<18} | {'✅ PASS' if aot.passed else '⚠️ WARN':<18}\n"
     )
-    print("-" * 80)
-    print(f"{'AOT Speedup':<25} | {speedup:.2f}x faster")
-    print("=" * 80)
-
+    w("-" * 80 + "\n")
+    w(f"{'AOT Speedup':<25} | {speedup:.2f}x faster\n")
+    w("=" * 80 + "\n")
 
-def _format_time_cell(baseline: float, all_mode: float, overhead_pct: float) -> str:
-    # Format: "1.45ms -> 1.48ms (+1.7%)"
-    return f"{baseline:.2f}ms -> {all_mode:.2f}ms ({overhead_pct:+.1f}%)"
+    sys.stdout.write(buf.getvalue())
 
 
 def _print_comparative_comparison(
     jit: ComparativeBenchmarkResult, aot: ComparativeBenchmarkResult
 ):
+    buf = io.StringIO()
+    w = buf.write
+
     # Print JIT Table
-    print(
-        f"{'METRIC':<20} | {'MODE':<12} | {'JIT (dart run)':<30} | {'AOT (compiled)':<30}"
+    w(
+        f"{'METRIC':<20} | {'MODE':<12} | {'JIT (dart run)':<30} | {'AOT (compiled)':<30}\n"
     )
-    print("-" * 100)
+    w("-" * 100 + "\n")
 
     # QR Row
-    jit_qr_str = _format_time_cell(
+    jit_qr_str = _TIME_CELL_TPL.format(
         jit.qr_baseline_ms, jit.qr_all_ms, jit.qr_overhead_pct
     )
-    aot_qr_str = _format_time_cell(
+    aot_qr_str = _TIME_CELL_TPL.format(
         aot.qr_baseline_ms, aot.qr_all_ms, aot.qr_overhead_pct
     )
-    print(
-        f"{'QR Standard':<20} | {'qr -> all':<12} | {jit_qr_str:<30} | {aot_qr_str:<30}"
+    w(
+        f"{'QR Standard':<20} | {'qr -> all':<12} | {jit_qr_str:<30} | {aot_qr_str:<30}\n"
     )
 
     # QR Stress Row
-    jit_stress_str = _format_time_cell(
+    jit_stress_str = _TIME_CELL_TPL.format(
         jit.qr_stress_baseline_ms, jit.qr_stress_all_ms, jit.qr_stress_overhead_pct
     )
-    aot_stress_str = _format_time_cell(
+    aot_stress_str = _TIME_CELL_TPL.format(
         aot.qr_stress_baseline_ms, aot.qr_stress_all_ms, aot.qr_stress_overhead_pct
     )
-    print(
-        f"{'QR Stress':<20} | {'qr -> all':<12} | {jit_stress_str:<30} | {aot_stress_str:<30}"
+    w(
+        f"{'QR Stress':<20} | {'qr -> all':<12} | {jit_stress_str:<30} | {aot_stress_str:<30}\n"
     )
 
     # Barcode Row
-    jit_bc_str = _format_time_cell(
+    jit_bc_str = _TIME_CELL_TPL.format(
         jit.barcode_baseline_ms, jit.barcode_all_ms, jit.barcode_overhead_pct
     )
-    aot_bc_str = _format_time_cell(
+    aot_bc_str = _TIME_CELL_TPL.format(
         aot.barcode_baseline_ms, aot.barcode_all_ms, aot.barcode_overhead_pct
     )
-    print(f"{'Barcode':<20} | {'bar -> all':<12} | {jit_bc_str:<30} | {aot_bc_str:<30}")
+    w(f"{'Barcode':<20} | {'bar -> all':<12} | {jit_bc_str:<30} | {aot_bc_str:<30}\n")
 
-    print("-" * 100)
-    print(
-        f"{'Status':<35} | {'✅ PASS' if jit.passed else '⚠️ WARN':<30} | {'✅ PASS' if aot.passed else '⚠️ WARN':<30}"
+    w("-" * 100 + "\n")
+    w(
+        f"{'Status':<35} | {'✅ PASS' if jit.passed else '⚠️ WARN':<30} | {'✅ PASS' if aot.passed else '⚠️ WARN':<30}\n"
     )
 
     # Print Categories (AOT)
     if aot.qr_categories:
-        print("\n📈 QR Performance by Category (AOT - Yomu.all):")
-        print(f"{'Category':<15} | {'Average':<15} | {'p95':<15}")
-        print("-" * 50)
+        w("\n📈 QR Performance by Category (AOT - Yomu.all):\n")
+        w(f"{'Category':<15} | {'Average':<15} | {'p95':<15}\n")
+        w("-" * 50 + "\n")
         cats = aot.qr_categories
         for cat in [
             "Standard",
@@ -566,12 +710,12 @@ def _print_comparative_comparison(
         ]:
             if cat in cats:
                 c = cats[cat]
-                print(f"{cat:<15} | {c[2]:.3f}ms        | {c[3]:.3f}ms")
+                w(f"{cat:<15} | {c[2]:.3f}ms        | {c[3]:.3f}ms\n")
 
     if aot.barcode_categories and len(aot.barcode_categories) > 0:
-        print("\n📈 Barcode Performance by Category (AOT - Yomu.all):")
-        print(f"{'Category':<15} | {'Average':<15} | {'p95':<15}")
-        print("-" * 50)
+        w("\n📈 Barcode Performance by Category (AOT - Yomu.all):\n")
+        w(f"{'Category':<15} | {'Average':<15} | {'p95':<15}\n")
+        w("-" * 50 + "\n")
         cats = aot.barcode_categories
         for cat in [
             "Standard",
@@ -584,44 +728,70 @@ def _print_comparative_comparison(
         ]:
             if cat in cats:
                 c = cats[cat]
-                print(f"{cat:<15} | {c[2]:.3f}ms        | {c[3]:.3f}ms")
+                w(f"{cat:<15} | {c[2]:.3f}ms        | {c[3]:.3f}ms\n")
+
+    w("=" * 100 + "\n")
+
+    sys.stdout.write(buf.getvalue())
+
+    # Generate and save report
+    report = generate_markdown_report(jit, aot)
+    with open("benchmark_summary.md", "w") as f:
+        f.write(report)
+    sys.stdout.write(
+        "\n📝 Report saved to benchmark_summary.md\n"
+        "   (See benchmark_summary.md for detailed per-image breakdown)\n"
+    )
+
+
+# Comparison printers keyed by result KIND
+_PRINTERS = {
+    LegacyBenchmarkResult.KIND: _print_legacy_comparison,
+    ComparativeBenchmarkResult.KIND: _print_comparative_comparison,
+}
 
-    print("=" * 100)
+
+def _dataclass_to_dict(obj):
+    # json.dump fallback: a shallow dict that shares the field values
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 def save_results(
     path: str, jit: Optional[BenchmarkResult], aot: Optional[BenchmarkResult]
 ):
     """Save benchmark results to a JSON file."""
-    data = {
-        "jit": asdict(jit) if jit and is_dataclass(jit) else None,
-        "aot": asdict(aot) if aot and is_dataclass(aot) else None,
-    }
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2)
+    # Both serializers walk the result containers directly, no asdict() copy
+    data = {"jit": jit, "aot": aot}
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2, default=_dataclass_to_dict)
     print(f"\n💾 Results saved to {path}")
 
 
 def load_results(path: str) -> dict:
     """Load benchmark results from a JSON file."""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
     with open(path, "r") as f:
         return json.load(f)
 
 
 def generate_comparison_report(base_data: dict, target_data: dict) -> str:
     """Generate a Markdown report comparing Base vs Target (HEAD)."""
-    md = []
-    md.append("# 🚀 Benchmark Comparison Report")
-    md.append("")
+    buf = io.StringIO()
+    w = buf.write
+    w(_MD_COMPARISON_HEADER)
 
     # We focus deeply on AOT results for the comparison as it is the prod target
     base_aot = base_data.get("aot")
     target_aot = target_data.get("aot")
 
     if not base_aot or not target_aot:
-        md.append(
-            "> ⚠️ Missing AOT data in one or both reports. Comparing JIT if available."
-        )
+        w("> ⚠️ Missing AOT data in one or both reports. Comparing JIT if available.\n")
         # Fallback logic could go here, but let's stick to AOT for now or show error
 
     # Helper to extract metric
@@ -637,9 +807,7 @@ def generate_comparison_report(base_data: dict, target_data: dict) -> str:
     base_qr_avg = get_metric(base_aot, "qr_all_ms")
     target_qr_avg = get_metric(target_aot, "qr_all_ms")
 
-    md.append("## 🏁 Main Metrics (AOT)")
-    md.append("| Metric | Base (main) | Target (PR) | Diff | State |")
-    md.append("| :--- | :--- | :--- | :--- | :--- |")
+    w(_MD_COMPARISON_METRICS_HEADER)
 
     def row(label, base, target):
         diff = target - base
@@ -647,46 +815,25 @@ def generate_comparison_report(base_data: dict, target_data: dict) -> str:
         icon = "🟢" if diff <= 0 else "🔴"
         if abs(diff) < 0.05:
             icon = "⚪"  # Noise threshold
-        return f"| **{label}** | {base:.3f}ms | {target:.3f}ms | {diff:+.3f}ms ({pct:+.1f}%) | {icon} |"
+        return f"| **{label}** | {base:.3f}ms | {target:.3f}ms | {diff:+.3f}ms ({pct:+.1f}%) | {icon} |\n"
 
-    md.append(row("QR Code Avg", base_qr_avg, target_qr_avg))
+    w(row("QR Code Avg", base_qr_avg, target_qr_avg))
 
     base_bar_avg = get_metric(base_aot, "barcode_all_ms")
     target_bar_avg = get_metric(target_aot, "barcode_all_ms")
-    md.append(row("Barcode Avg", base_bar_avg, target_bar_avg))
+    w(row("Barcode Avg", base_bar_avg, target_bar_avg))
 
     # Category Comparison
     base_cats = base_aot.get("qr_categories", {}) if base_aot else {}
     target_cats = target_aot.get("qr_categories", {}) if target_aot else {}
 
     if base_cats or target_cats:
-        md.append("")
-        md.append("## 📊 QR Category Breakdown")
-        md.append("| Category | Base Avg | Target Avg | Diff |")
-        md.append("| :--- | :--- | :--- | :--- |")
-
-        all_cats = set(list(base_cats.keys()) + list(target_cats.keys()))
-        # Define sort order
-        cat_order = [
-            "Standard",
-            "Complex",
-            "4K",
-            "FullHD",
-            "Distorted",
-            "Noise",
-            "Edge",
-        ]
+        w(_MD_COMPARISON_CATEGORY_HEADER)
 
-        all_cats = set(list(base_cats.keys()) + list(target_cats.keys()))
+        all_cats = base_cats.keys() | target_cats.keys()
 
         # Sort based on defined order, put undefined ones at the end
-        def sort_key(k):
-            try:
-                return cat_order.index(k)
-            except ValueError:
-                return 999
-
-        for cat in sorted(all_cats, key=sort_key):
+        for cat in sorted(all_cats, key=lambda k: _CAT_ORDER_MAP.get(k, 999)):
             # Format is [base_base, base_all, base_all, base_all]?
             # No, dict value is [base_avg, base_p95, all_avg, all_p95]
             # We want index 2 (all_avg)
@@ -695,11 +842,11 @@ def generate_comparison_report(base_data: dict, target_data: dict) -> str:
 
             diff = t_val - b_val
             pct = (diff / b_val * 100) if b_val > 0 else 0
-            md.append(
-                f"| {cat} | {b_val:.3f}ms | {t_val:.3f}ms | {diff:+.3f}ms ({pct:+.1f}%) |"
+            w(
+                f"| {cat} | {b_val:.3f}ms | {t_val:.3f}ms | {diff:+.3f}ms ({pct:+.1f}%) |\n"
             )
 
-    return "\n".join(md)
+    return buf.getvalue()
 
 
 def main():
@@ -724,6 +871,12 @@ def main():
         default="all",
         help="Benchmark mode (jit, aot, or all)",
     )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run JIT and AOT concurrently in 'all' mode "
+        "(faster, but the two runs skew each other's timings)",
+    )
 
     args = parser.parse_args()
 
@@ -750,14 +903,14 @@ def main():
     target_script = args.script
 
     # Check we're in the right directory
-    if not Path(target_script).exists():
-        print(f"❌ Error: Benchmark script not found: {target_script}")
-        sys.exit(1)
-
-    if not Path("fixtures/qr_images").exists():
-        print(
-            "❌ Error: Test images not found. Run: uv run scripts/generate_test_qr.py"
-        )
+    required = {
+        target_script: f"Benchmark script not found: {target_script}",
+        "fixtures/qr_images": "Test images not found. Run: uv run scripts/generate_test_qr.py",
+    }
+    missing = [msg for path, msg in required.items() if not os.path.exists(path)]
+    if missing:
+        for msg in missing:
+            print(f"❌ Error: {msg}")
         sys.exit(1)
 
     print("=" * 80)
@@ -770,22 +923,33 @@ def main():
     jit_result = None
     aot_result = None
 
-    # Run JIT benchmark
-    if args.mode in ["jit", "all"]:
-        jit_result = run_jit_benchmark(target_script)
+    # Run both benchmarks at once (opt-in: they compete for CPU)
+    if args.mode == "all" and args.parallel:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            jit_future = executor.submit(run_jit_benchmark, target_script)
+            aot_future = executor.submit(run_aot_benchmark, target_script)
+            jit_result, aot_result = jit_future.result(), aot_future.result()
         if not jit_result:
             print("❌ JIT benchmark failed")
-            if args.mode == "jit":
-                sys.exit(1)
-        print()
-
-    # Run AOT benchmark
-    if args.mode in ["aot", "all"]:
-        aot_result = run_aot_benchmark(target_script)
         if not aot_result:
             print("❌ AOT benchmark failed")
-            if args.mode == "aot":
-                sys.exit(1)
+    else:
+        # Run JIT benchmark
+        if args.mode in ["jit", "all"]:
+            jit_result = run_jit_benchmark(target_script)
+            if not jit_result:
+                print("❌ JIT benchmark failed")
+                if args.mode == "jit":
+                    sys.exit(1)
+            print()
+
+        # Run AOT benchmark
+        if args.mode in ["aot", "all"]:
+            aot_result = run_aot_benchmark(target_script)
+            if not aot_result:
+                print("❌ AOT benchmark failed")
+                if args.mode == "aot":
+                    sys.exit(1)
 
     # Print comparison if both available, otherwise just print what we have
     if jit_result and aot_result:
@@ -819,22 +983,38 @@ def main():
 
 def print_single_result(result: BenchmarkResult, label: str):
     """Print results for a single mode (JIT or AOT)."""
-    if isinstance(result, ComparativeBenchmarkResult):
-        print(f"{label} Result (QR Standard): Avg {result.qr_all_ms:.3f}ms")
-        print(f"{label} Result (QR Stress):   Avg {result.qr_stress_all_ms:.3f}ms")
-        print(f"{label} Result (Barcode):     Avg {result.barcode_all_ms:.3f}ms")
-
-        if result.qr_categories:
-            print(f"\n📈 QR Performance ({label}):")
-            for cat, val in sorted(result.qr_categories.items()):
-                print(f"  {cat:<10}: Avg {val[2]:.3f}ms | p95 {val[3]:.3f}ms")
-
-        if result.barcode_categories:
-            print(f"\n📈 Barcode Performance ({label}):")
-            for cat, val in sorted(result.barcode_categories.items()):
-                print(f"  {cat:<10}: Avg {val[2]:.3f}ms | p95 {val[3]:.3f}ms")
-    else:
-        print(f"{label} Result: Avg {result.avg_time_ms:.3f}ms")
+    _SINGLE_PRINTERS[result.KIND](result, label)
+
+
+def _print_legacy_single(result: LegacyBenchmarkResult, label: str):
+    print(f"{label} Result: Avg {result.avg_time_ms:.3f}ms")
+
+
+def _print_comparative_single(result: ComparativeBenchmarkResult, label: str):
+    buf = io.StringIO()
+    w = buf.write
+
+    w(f"{label} Result (QR Standard): Avg {result.qr_all_ms:.3f}ms\n")
+    w(f"{label} Result (QR Stress):   Avg {result.qr_stress_all_ms:.3f}ms\n")
+    w(f"{label} Result (Barcode):     Avg {result.barcode_all_ms:.3f}ms\n")
+
+    if result.qr_categories:
+        w(f"\n📈 QR Performance ({label}):\n")
+        for cat, val in sorted(result.qr_categories.items()):
+            w(f"  {cat:<10}: Avg {val[2]:.3f}ms | p95 {val[3]:.3f}ms\n")
+
+    if result.barcode_categories:
+        w(f"\n📈 Barcode Performance ({label}):\n")
+        for cat, val in sorted(result.barcode_categories.items()):
+            w(f"  {cat:<10}: Avg {val[2]:.3f}ms | p95 {val[3]:.3f}ms\n")
+
+    sys.stdout.write(buf.getvalue())
+
+
+_SINGLE_PRINTERS = {
+    LegacyBenchmarkResult.KIND: _print_legacy_single,
+    ComparativeBenchmarkResult.KIND: _print_comparative_single,
+}
 
 
 if __name__ == "__main__":
@@ -36,6 +36,12 @@ class CleanImageWriter(ImageWriter):
             }
         )
 
+    def save(self, filename: str, output) -> str:
+        # Fast zlib level: fixtures are write-once, size matters less
+        filename = f"{filename}.{self.format.lower()}"
+        output.save(filename, self.format.upper(), compress_level=1)
+        return filename
+
 
 def generate_barcode(barcode_type: str, data: str, filename: str) -> Optional[str]:
     """Generate a barcode image."""
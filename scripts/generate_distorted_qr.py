@@ -4,7 +4,6 @@
 # dependencies = [
 #     "qrcode[pil]",
 #     "pillow",
-#     "numpy",
 # ]
 # ///
 """
@@ -17,15 +16,20 @@ Creates images with:
 Standard Output: 600x600 PNG with 400x400 QR centered.
 """
 
+import hashlib
+import inspect
 import os
 import math
-import numpy as np
+from pathlib import Path
+
 import qrcode
 from PIL import Image
 
 OUTPUT_DIR = "fixtures/distorted_images"
 CANVAS_SIZE = 600
 QR_SIZE = 400
+# Encoded base QR codes, reused across runs
+QR_CACHE_DIR = Path(".cache/qr")
 
 
 def create_base_qr(data: str) -> Image.Image:
@@ -42,6 +46,26 @@ def create_base_qr(data: str) -> Image.Image:
     return img.resize((QR_SIZE, QR_SIZE), Image.Resampling.NEAREST)
 
 
+def load_base_qr(data: str) -> Image.Image:
+    """create_base_qr, memoized on disk.
+
+    The key covers the data, QR_SIZE and create_base_qr's own source, so
+    changing the encoder settings invalidates old entries.
+    """
+    source = f"{data}|{QR_SIZE}|{inspect.getsource(create_base_qr)}"
+    key = hashlib.sha1(source.encode()).hexdigest()[:16]
+    path = QR_CACHE_DIR / f"{key}.png"
+    if path.exists():
+        img = Image.open(path)
+        img.load()
+        return img
+
+    img = create_base_qr(data)
+    QR_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    img.save(path, compress_level=1)
+    return img
+
+
 def place_on_canvas(img: Image.Image) -> Image.Image:
     """Center image on 600x600 white canvas."""
     canvas = Image.new("RGB", (CANVAS_SIZE, CANVAS_SIZE), "white")
@@ -50,10 +74,8 @@ def place_on_canvas(img: Image.Image) -> Image.Image:
     return canvas
 
 
-def apply_rotation(img: Image.Image, angle: float) -> Image.Image:
-    """Rotate image by angle (degrees) on fixed canvas."""
-    # Place on 600x600 canvas first
-    canvas = place_on_canvas(img)
+def apply_rotation(canvas: Image.Image, angle: float) -> Image.Image:
+    """Rotate a centered canvas (see place_on_canvas) by angle (degrees)."""
     # Rotate around center, keeping size fixed (expand=False)
     # 400x400 rotated 45deg fits inside 600x600 (approx 566px diagonal)
     return canvas.rotate(
@@ -63,26 +85,42 @@ def apply_rotation(img: Image.Image, angle: float) -> Image.Image:
 
 def find_coeffs(source_coords, target_coords):
     """Calculate coefficients for perspective transform."""
-    matrix = []
-    for i, (s, t) in enumerate(zip(source_coords, target_coords)):
-        matrix.append([t[0], t[1], 1, 0, 0, 0, -s[0] * t[0], -s[0] * t[1]])
-        matrix.append([0, 0, 0, t[0], t[1], 1, -s[1] * t[0], -s[1] * t[1]])
-    A = np.matrix(matrix, dtype=float)
-    B = np.array(source_coords).reshape(8)
-    res = np.linalg.solve(A, B)
-    return np.array(res).reshape(8)
+    # Augmented 8x9 system, two rows per point pair: x row, then y row
+    rows = []
+    for (sx, sy), (tx, ty) in zip(source_coords, target_coords):
+        rows.append([tx, ty, 1.0, 0.0, 0.0, 0.0, -sx * tx, -sx * ty, sx])
+        rows.append([0.0, 0.0, 0.0, tx, ty, 1.0, -sy * tx, -sy * ty, sy])
+
+    # Gaussian elimination with partial pivoting; far too small for LAPACK
+    # to pay off
+    for col in range(8):
+        pivot = max(range(col, 8), key=lambda r: abs(rows[r][col]))
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        pivot_row = rows[col]
+        for r in range(col + 1, 8):
+            factor = rows[r][col] / pivot_row[col]
+            if factor:
+                row = rows[r]
+                for c in range(col, 9):
+                    row[c] -= factor * pivot_row[c]
+
+    coeffs = [0.0] * 8
+    for r in range(7, -1, -1):
+        row = rows[r]
+        acc = row[8] - sum(row[c] * coeffs[c] for c in range(r + 1, 8))
+        coeffs[r] = acc / row[r]
+    return coeffs
 
 
 def apply_perspective_tilt(
-    img: Image.Image, x_angle: float, y_angle: float
+    canvas: Image.Image, x_angle: float, y_angle: float
 ) -> Image.Image:
     """
-    Apply perspective projection to simulate tilting.
+    Apply perspective projection to a centered canvas to simulate tilting.
     x_angle: Tilt around X-axis (degrees)
     y_angle: Tilt around Y-axis (degrees)
     """
-    # 1. Place on canvas
-    canvas = place_on_canvas(img)
+    # 1. Canvas size
     w, h = canvas.size  # 600, 600
 
     # 2. Define Source points (Corners of 600x600 canvas)
@@ -138,14 +176,16 @@ def main():
     print(f"Canvas Size: {CANVAS_SIZE}x{CANVAS_SIZE}, QR Size: {QR_SIZE}x{QR_SIZE}")
 
     base_data = "DISTORTION_TEST_DATA_1234567890"
-    base_img = create_base_qr(base_data)
+    base_img = load_base_qr(base_data)
+    # rotate() and transform() return new images, so one canvas serves all
+    base_canvas = place_on_canvas(base_img)
 
     # 1. Rotations (Guaranteed Range)
     rotations = [5, 10, 15, -5, -10, -15]
     for angle in rotations:
-        res = apply_rotation(base_img, angle)
+        res = apply_rotation(base_canvas, angle)
         name = f"rotation_{angle}deg.png"
-        res.save(f"{OUTPUT_DIR}/{name}")
+        res.save(f"{OUTPUT_DIR}/{name}", compress_level=1)
         print(f"  ✓ {name}")
 
     # 2. Perspective Tilts (X, Y) - Matrix 0, 3, 6
@@ -157,9 +197,9 @@ def main():
             tilts.append((x, y))
 
     for ax, ay in tilts:
-        res = apply_perspective_tilt(base_img, ax, ay)
+        res = apply_perspective_tilt(base_canvas, ax, ay)
         name = f"tilt_x{ax}_y{ay}.png"
-        res.save(f"{OUTPUT_DIR}/{name}")
+        res.save(f"{OUTPUT_DIR}/{name}", compress_level=1)
         print(f"  ✓ {name}")
 
     print(f"Generated {len(rotations) + len(tilts)} images.")
@@ -16,6 +16,7 @@ Usage:
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 SCRIPTS = [
     "scripts/generate_test_qr.py",  # Standard QR codes
@@ -28,8 +29,8 @@ SCRIPTS = [
 ]
 
 
-def run_script(script_path: str):
-    print(f"🔄 Running {script_path}...")
+def run_script(script_path: str) -> tuple[bool, str]:
+    """Run one generator script, returning (success, log to print)."""
     try:
         # Check if uv is available, otherwise try python3 directly
         # Assuming we are running within the project root
@@ -38,15 +39,11 @@ def run_script(script_path: str):
         result = subprocess.run(cmd, capture_output=True, text=True)
 
         if result.returncode != 0:
-            print(f"❌ Failed: {script_path}")
-            print(result.stderr)
-            return False
+            return False, f"❌ Failed: {script_path}\n{result.stderr}"
 
-        print(f"✅ Done: {script_path}")
-        return True
+        return True, f"✅ Done: {script_path}"
     except FileNotFoundError:
-        print("❌ Error: 'uv' command not found or script missing.")
-        return False
+        return False, "❌ Error: 'uv' command not found or script missing."
 
 
 def main():
@@ -58,8 +55,17 @@ def main():
     start_time = time.time()
     success_count = 0
 
+    # Scripts write disjoint files, so run them all at once. Threads are
+    # enough here since each one just waits on its subprocess.
     for script in SCRIPTS:
-        if run_script(script):
+        print(f"🔄 Running {script}...")
+    with ThreadPoolExecutor(max_workers=len(SCRIPTS)) as executor:
+        results = list(executor.map(run_script, SCRIPTS))
+
+    # Report in SCRIPTS order regardless of completion order
+    for ok, log in results:
+        print(log)
+        if ok:
             success_count += 1
 
     elapsed = time.time() - start_time
@@ -19,20 +19,11 @@ import qrcode
 from PIL import Image
 
 
-def generate_multi_qr_image(
-    qr_data: list[str], filename: str, layout: str = "horizontal"
-):
-    """
-    Generate an image containing multiple QR codes.
-
-    Args:
-        qr_data: List of strings to encode in each QR code
-        filename: Output filename
-        layout: "horizontal", "vertical", or "grid"
-    """
+def _compose_multi_qr(qr_data: list[str], layout: str) -> np.ndarray:
+    """Lay out one QR code per string on a white RGB pixel array."""
     qr_codes = []
 
-    # Generate QR codes (force RGB mode for easier manipulation)
+    # Generate QR codes as boolean module masks (True = white)
     for data in qr_data:
         qr = qrcode.QRCode(
             version=1,
@@ -43,47 +34,59 @@ def generate_multi_qr_image(
         qr.add_data(data)
         qr.make(fit=True)
         img = qr.make_image(fill_color="black", back_color="white")
-        # Convert to RGB for consistent paste operations
-        img_rgb = img.convert("RGB")
-        qr_codes.append(img_rgb)
+        qr_codes.append(np.asarray(img.get_image(), dtype=bool))
 
     if not qr_codes:
-        print("No QR data provided")
-        return
+        return None
 
     # Calculate canvas size
-    qr_size = qr_codes[0].size[0]  # Assuming all QR codes are same size
+    qr_size = qr_codes[0].shape[0]  # Assuming all QR codes are same size
 
     if layout == "horizontal":
+        positions = [(i * qr_size, 0) for i in range(len(qr_codes))]
         canvas_width = qr_size * len(qr_codes)
         canvas_height = qr_size
     elif layout == "vertical":
+        positions = [(0, i * qr_size) for i in range(len(qr_codes))]
         canvas_width = qr_size
         canvas_height = qr_size * len(qr_codes)
     elif layout == "grid":
-        # 2x2 grid
+        # 2x2 grid, max 4 codes
+        positions = [(0, 0), (qr_size, 0), (0, qr_size), (qr_size, qr_size)]
         canvas_width = qr_size * 2
         canvas_height = qr_size * 2
     else:
         raise ValueError(f"Unknown layout: {layout}")
 
-    # Create canvas (RGB mode)
-    canvas = Image.new("RGB", (canvas_width, canvas_height), (255, 255, 255))
+    # Copy each code's modules straight into the canvas buffer, clipped to
+    # the canvas like Image.paste (fit=True may grow a code past version 1)
+    canvas = np.full((canvas_height, canvas_width, 3), 255, dtype=np.uint8)
+    for (x, y), modules in zip(positions, qr_codes):
+        h = min(modules.shape[0], canvas_height - y)
+        w = min(modules.shape[1], canvas_width - x)
+        canvas[y : y + h, x : x + w] = modules[:h, :w, None] * np.uint8(255)
 
-    # Paste QR codes
-    if layout == "horizontal":
-        for i, qr_img in enumerate(qr_codes):
-            canvas.paste(qr_img, (i * qr_size, 0))
-    elif layout == "vertical":
-        for i, qr_img in enumerate(qr_codes):
-            canvas.paste(qr_img, (0, i * qr_size))
-    elif layout == "grid":
-        positions = [(0, 0), (qr_size, 0), (0, qr_size), (qr_size, qr_size)]
-        for i, qr_img in enumerate(qr_codes[:4]):  # Max 4 for 2x2 grid
-            canvas.paste(qr_img, positions[i])
+    return canvas
 
-    canvas.save(filename)
-    print(f"Generated {filename} with {len(qr_codes)} QR codes ({layout} layout)")
+
+def generate_multi_qr_image(
+    qr_data: list[str], filename: str, layout: str = "horizontal"
+):
+    """
+    Generate an image containing multiple QR codes.
+
+    Args:
+        qr_data: List of strings to encode in each QR code
+        filename: Output filename
+        layout: "horizontal", "vertical", or "grid"
+    """
+    canvas = _compose_multi_qr(qr_data, layout)
+    if canvas is None:
+        print("No QR data provided")
+        return
+
+    Image.fromarray(canvas, "RGB").save(filename, compress_level=1)
+    print(f"Generated {filename} with {len(qr_data)} QR codes ({layout} layout)")
 
 
 def generate_noisy_multi_qr(filename: str, intensity: float = 0.10):
@@ -92,23 +95,13 @@ def generate_noisy_multi_qr(filename: str, intensity: float = 0.10):
     the sheet fails the fast path at once, exercising the despeckle pass
     of `decodeAll` (tryHarder).
     """
-    tmp_path = filename + ".tmp.png"
-    generate_multi_qr_image(
-        ["Noise A", "Noise B", "Noise C"],
-        tmp_path,
-        "vertical",
-    )
-    img = Image.open(tmp_path).convert("RGB")
-    import os
-
-    os.remove(tmp_path)
+    pixels = _compose_multi_qr(["Noise A", "Noise B", "Noise C"], "vertical")
 
     np.random.seed(45)
-    pixels = np.array(img)
     noise = np.random.rand(*pixels.shape[:2])
     pixels[noise < (intensity / 2)] = [255, 255, 255]
     pixels[noise > (1 - intensity / 2)] = [0, 0, 0]
-    Image.fromarray(pixels).save(filename)
+    Image.fromarray(pixels).save(filename, compress_level=1)
     print(f"Generated {filename} (3 codes, salt & pepper {intensity:.0%})")
 
 
@@ -134,7 +127,7 @@ def generate_small_multi_qr_4k(filename: str):
     canvas = Image.new("RGB", (3840, 2160), (255, 255, 255))
     canvas.paste(codes[0], (400, 400))
     canvas.paste(codes[1], (2800, 1400))
-    canvas.save(filename)
+    canvas.save(filename, compress_level=1)
     print(f"Generated {filename} (2 small codes in 4K)")
 
 
@@ -4,6 +4,7 @@
 # dependencies = [
 #     "qrcode",
 #     "pillow",
+#     "numpy",
 # ]
 # ///
 """
@@ -15,8 +16,10 @@ Usage:
     uv run scripts/generate_performance_test_images.py
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import numpy as np
 import qrcode
 from PIL import Image  # type: ignore
 
@@ -46,22 +49,17 @@ def create_background(width: int, height: int, style: str) -> Image.Image:
     elif style == "gray":
         return Image.new("RGB", (width, height), (200, 200, 200))
     elif style == "gradient":
-        img = Image.new("RGB", (width, height))
-        for y in range(height):
-            gray = int(255 * (1 - y / height * 0.3))  # Light gradient
-            for x in range(width):
-                img.putpixel((x, y), (gray, gray, gray))
-        return img
+        # Light gradient, one gray level per row
+        gray = (255 * (1 - np.arange(height) / height * 0.3)).astype(np.uint8)
+        arr = np.empty((height, width, 3), dtype=np.uint8)
+        arr[:] = gray[:, None, None]
+        return Image.fromarray(arr, "RGB")
     elif style == "noise":
-        import random
-
-        img = Image.new("RGB", (width, height))
-        for y in range(height):
-            for x in range(width):
-                # Light noise
-                v = random.randint(240, 255)
-                img.putpixel((x, y), (v, v, v))
-        return img
+        # Light noise, same value on all channels
+        v = np.random.default_rng().integers(
+            240, 256, size=(height, width, 1), dtype=np.uint8
+        )
+        return Image.fromarray(np.repeat(v, 3, axis=2), "RGB")
     return Image.new("RGB", (width, height), "white")
 
 
@@ -72,12 +70,57 @@ def generate_qr(data: str, size: int) -> Image.Image:
         error_correction=qrcode.constants.ERROR_CORRECT_M,
         box_size=10,
         border=2,
+        # Any mask decodes; skip the eight-way penalty search
+        mask_pattern=0,
     )
     qr.add_data(data)
     qr.make(fit=True)
 
-    img = qr.make_image(fill_color="black", back_color="white")
-    return img.resize((size, size), Image.NEAREST)
+    # Scale modules by a whole factor (matrix includes the border) and pad
+    # the remainder with white, instead of a NEAREST resize that renders
+    # modules at uneven widths
+    modules = np.where(qr.get_matrix(), 0, 255).astype(np.uint8)
+    scale = max(1, size // len(modules))
+    arr = np.repeat(np.repeat(modules, scale, axis=0), scale, axis=1)
+    pad = size - arr.shape[0]
+    before = pad // 2
+    arr = np.pad(arr, (before, pad - before), constant_values=255)
+    return Image.fromarray(arr, "L")
+
+
+def generate_background_set(
+    width: int,
+    height: int,
+    name: str,
+    bg_style: str,
+    qr_sizes: list[int],
+    output_dir: Path,
+) -> list[str]:
+    """Generate every QR size/position on one background; returns filenames."""
+    filenames = []
+
+    # One background per style; each image pastes onto a copy
+    base_bg = create_background(width, height, bg_style)
+    for qr_size in qr_sizes:
+        for pos_name, pos_fn in POSITIONS.items():
+            bg = base_bg.copy()
+
+            # Create QR code
+            qr_data = f"PerfTest_{name}_{pos_name}_{qr_size}"
+            qr_img = generate_qr(qr_data, qr_size)
+
+            # Calculate position
+            x, y = pos_fn(width, height, qr_size, qr_size)
+
+            # Paste QR onto background
+            bg.paste(qr_img, (x, y))
+
+            # Save
+            filename = f"{name}_{bg_style}_{pos_name}_{qr_size}px.png"
+            bg.save(output_dir / filename, compress_level=1)
+            filenames.append(filename)
+
+    return filenames
 
 
 def main():
@@ -91,30 +134,19 @@ def main():
 
     count = 0
 
-    for width, height, name, qr_sizes, backgrounds in CONFIGS:
-        for bg_style in backgrounds:
-            for qr_size in qr_sizes:
-                for pos_name, pos_fn in POSITIONS.items():
-                    # Create background
-                    bg = create_background(width, height, bg_style)
-
-                    # Create QR code
-                    qr_data = f"PerfTest_{name}_{pos_name}_{qr_size}"
-                    qr_img = generate_qr(qr_data, qr_size)
-
-                    # Calculate position
-                    x, y = pos_fn(width, height, qr_size, qr_size)
-
-                    # Paste QR onto background
-                    bg.paste(qr_img, (x, y))
-
-                    # Save
-                    filename = f"{name}_{bg_style}_{pos_name}_{qr_size}px.png"
-                    filepath = output_dir / filename
-                    bg.save(filepath)
-
-                    print(f"✓ {filename} ({width}x{height})")
-                    count += 1
+    # Background sets are independent and dominated by PNG encoding, so
+    # generate them in parallel; results are printed in CONFIGS order
+    tasks = [
+        (width, height, name, bg_style, qr_sizes, output_dir)
+        for width, height, name, qr_sizes, backgrounds in CONFIGS
+        for bg_style in backgrounds
+    ]
+    with ProcessPoolExecutor() as executor:
+        futures = [executor.submit(generate_background_set, *task) for task in tasks]
+        for (width, height, *_), future in zip(tasks, futures):
+            for filename in future.result():
+                print(f"✓ {filename} ({width}x{height})")
+                count += 1
 
     print("-" * 60)
     print(f"Generated {count} performance test images in {output_dir}/")
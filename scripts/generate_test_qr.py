@@ -86,7 +86,7 @@ def generate_qr(
     qr.make(fit=True)
 
     img = qr.make_image(fill_color="black", back_color="white")
-    img.save(output_path)
+    img.save(output_path, compress_level=1)
 
 
 def get_ec_label(ec_int: int) -> str:
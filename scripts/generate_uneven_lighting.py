@@ -32,49 +32,77 @@ def create_qr(data: str, size: int = 400) -> np.ndarray:
     qr = qrcode.QRCode(version=1, box_size=10, border=4)
     qr.add_data(data)
     qr.make(fit=True)
-    img = qr.make_image(fill_color="black", back_color="white")
-    img = img.resize((size, size), Image.Resampling.LANCZOS)
-    return np.array(img.convert("L"))
 
+    # Same expansion as generate_qr in generate_performance_test_images.py.
+    # The old LANCZOS resize of the mode "1" render fell back to NEAREST.
+    modules = np.where(qr.get_matrix(), 0, 255).astype(np.uint8)
+    scale = max(1, size // len(modules))
+    arr = np.repeat(np.repeat(modules, scale, axis=0), scale, axis=1)
+    pad = size - arr.shape[0]
+    before = pad // 2
+    return np.pad(arr, (before, pad - before), constant_values=255)
 
-def apply_horizontal_gradient(img: np.ndarray, strength: float = 0.5) -> np.ndarray:
+
+def _shade(
+    img: np.ndarray, gradient: np.ndarray, out: np.ndarray | None = None
+) -> np.ndarray:
+    """Multiply by a lighting gradient and clip in one float32 buffer."""
+    if out is None:
+        out = np.empty(img.shape, dtype=np.float32)
+    np.multiply(img, gradient, out=out)
+    np.clip(out, 0, 255, out=out)
+    return out.astype(np.uint8)
+
+
+def apply_horizontal_gradient(
+    img: np.ndarray, strength: float = 0.5, out: np.ndarray | None = None
+) -> np.ndarray:
     """Apply horizontal lighting gradient (left dark, right bright)."""
     h, w = img.shape
     gradient = np.linspace(1 - strength, 1, w).reshape(1, w)
-    return np.clip(img * gradient, 0, 255).astype(np.uint8)
+    return _shade(img, gradient, out)
 
 
-def apply_vertical_gradient(img: np.ndarray, strength: float = 0.5) -> np.ndarray:
+def apply_vertical_gradient(
+    img: np.ndarray, strength: float = 0.5, out: np.ndarray | None = None
+) -> np.ndarray:
     """Apply vertical lighting gradient (top dark, bottom bright)."""
     h, w = img.shape
     gradient = np.linspace(1 - strength, 1, h).reshape(h, 1)
-    return np.clip(img * gradient, 0, 255).astype(np.uint8)
+    return _shade(img, gradient, out)
 
 
-def apply_corner_shadow(img: np.ndarray, strength: float = 0.6) -> np.ndarray:
+def apply_corner_shadow(
+    img: np.ndarray, strength: float = 0.6, out: np.ndarray | None = None
+) -> np.ndarray:
     """Apply vignette-like shadow from corner."""
     h, w = img.shape
-    y, x = np.ogrid[:h, :w]
+    # float32 halves the scratch memory; 8-bit output needs no more
+    y, x = (axis.astype(np.float32) for axis in np.ogrid[:h, :w])
     # Distance from top-left corner
     dist = np.sqrt(x**2 + y**2)
-    max_dist = np.sqrt(h**2 + w**2)
+    max_dist = float(np.sqrt(h**2 + w**2))
     # Create gradient: 1-strength at corner, 1 at far corner
     gradient = (1 - strength) + strength * (dist / max_dist)
-    return np.clip(img * gradient, 0, 255).astype(np.uint8)
+    return _shade(img, gradient, out)
 
 
 def apply_spotlight(
-    img: np.ndarray, cx: float = 0.3, cy: float = 0.3, radius: float = 0.4
+    img: np.ndarray,
+    cx: float = 0.3,
+    cy: float = 0.3,
+    radius: float = 0.4,
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
     """Apply spotlight effect."""
     h, w = img.shape
-    y, x = np.ogrid[:h, :w]
+    y, x = (axis.astype(np.float32) for axis in np.ogrid[:h, :w])
     center_x, center_y = w * cx, h * cy
     dist = np.sqrt((x - center_x) ** 2 + (y - center_y) ** 2)
     max_radius = min(h, w) * radius
     # Bright in center, dark outside
     gradient = np.clip(1 - (dist / max_radius) * 0.6, 0.4, 1)
-    return np.clip(img * gradient, 0, 255).astype(np.uint8)
+    return _shade(img, gradient, out)
 
 
 def main():
@@ -86,26 +114,30 @@ def main():
     # Create base QR
     base_qr = create_qr(data, size=400)
 
-    # Apply different lighting conditions
+    # Apply different lighting conditions: (name, transform, args)
     conditions = [
-        ("horizontal_gradient_mild", lambda img: apply_horizontal_gradient(img, 0.3)),
-        ("horizontal_gradient_strong", lambda img: apply_horizontal_gradient(img, 0.6)),
-        ("vertical_gradient_mild", lambda img: apply_vertical_gradient(img, 0.3)),
-        ("vertical_gradient_strong", lambda img: apply_vertical_gradient(img, 0.6)),
-        ("corner_shadow_mild", lambda img: apply_corner_shadow(img, 0.4)),
-        ("corner_shadow_strong", lambda img: apply_corner_shadow(img, 0.7)),
-        ("spotlight_center", lambda img: apply_spotlight(img, 0.5, 0.5, 0.5)),
-        ("spotlight_corner", lambda img: apply_spotlight(img, 0.2, 0.2, 0.3)),
+        ("horizontal_gradient_mild", apply_horizontal_gradient, (0.3,)),
+        ("horizontal_gradient_strong", apply_horizontal_gradient, (0.6,)),
+        ("vertical_gradient_mild", apply_vertical_gradient, (0.3,)),
+        ("vertical_gradient_strong", apply_vertical_gradient, (0.6,)),
+        ("corner_shadow_mild", apply_corner_shadow, (0.4,)),
+        ("corner_shadow_strong", apply_corner_shadow, (0.7,)),
+        ("spotlight_center", apply_spotlight, (0.5, 0.5, 0.5)),
+        ("spotlight_corner", apply_spotlight, (0.2, 0.2, 0.3)),
     ]
 
-    for name, transform in conditions:
-        result = transform(base_qr)
+    # All conditions shade into one float scratch buffer
+    scratch = np.empty(base_qr.shape, dtype=np.float32)
+    for name, transform, args in conditions:
+        result = transform(base_qr, *args, out=scratch)
         path = os.path.join(OUTPUT_DIR, f"{name}.png")
-        Image.fromarray(result).save(path)
+        Image.fromarray(result).save(path, compress_level=1)
         print(f"Created: {path}")
 
     # Also save a clean reference
-    Image.fromarray(base_qr).save(os.path.join(OUTPUT_DIR, "reference_clean.png"))
+    Image.fromarray(base_qr).save(
+        os.path.join(OUTPUT_DIR, "reference_clean.png"), compress_level=1
+    )
     print(f"Created: {OUTPUT_DIR}/reference_clean.png")
 
     print(f"\nGenerated {len(conditions) + 1} test images in {OUTPUT_DIR}/")
@@ -5,6 +5,7 @@
 #     "qrcode",
 #     "pillow",
 #     "python-barcode",
+#     "numpy",
 # ]
 # ///
 """
@@ -22,8 +23,9 @@ Usage:
 
 import os
 
-import random
+import numpy as np
 import qrcode
+from PIL import Image
 
 
 def generate_versioned_qr(version: int, filename: str, data: str | None = None):
@@ -50,7 +52,7 @@ def generate_versioned_qr(version: int, filename: str, data: str | None = None):
 
     img = qr.make_image(fill_color="black", back_color="white")
     img = img.convert("RGB")  # Ensure consistent RGB format
-    img.save(filename)
+    img.save(filename, compress_level=1)
 
     dimension = 4 * version + 17
     print(f"Generated version {version} QR code: {filename}")
@@ -80,6 +82,11 @@ def generate_code128_with_codeset_a(filename: str):
                     }
                 )
 
+            def save(self, filename: str, output) -> str:
+                filename = f"{filename}.{self.format.lower()}"
+                output.save(filename, self.format.upper(), compress_level=1)
+                return filename
+
         # Code Set A handles control characters (ASCII 0-31) and uppercase
         # Including a control character (e.g., \r = ASCII 13) forces Code Set A
         data = "\rHELLO"
@@ -128,15 +135,14 @@ def generate_distorted_qr(version: int, filename: str):
 
     distorted = img.rotate(15, expand=True, fillcolor="white")
 
-    # Add some random noise
-    pixels = distorted.load()
-    width, height = distorted.size
-    for y in range(height):
-        for x in range(width):
-            if random.random() < 0.02:  # 2% salt and pepper noise
-                pixels[x, y] = (0, 0, 0) if random.random() < 0.5 else (255, 255, 255)
+    # Add some random noise: 2% salt and pepper, half of each
+    pixels = np.array(distorted)
+    noise = np.random.default_rng().random(pixels.shape[:2])
+    pixels[noise < 0.01] = (0, 0, 0)
+    pixels[(noise >= 0.01) & (noise < 0.02)] = (255, 255, 255)
+    distorted = Image.fromarray(pixels)
 
-    distorted.save(filename)
+    distorted.save(filename, compress_level=1)
     print(f"Generated distorted version {version} QR code: {filename}")
 
 